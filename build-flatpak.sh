@@ -22,6 +22,9 @@ APP_ID="com.github.dixonsolutions.CPify"
 MANIFEST="${APP_ID}.yml"
 BUILD_DIR="build-flatpak"
 REPO_DIR="flatpak-repo"
+# flatpak-builder's download/build cache; point this at a persistent
+# location (e.g. a CI cache mount) to reuse it across fresh checkouts
+STATE_DIR="${CPIFY_FLATPAK_STATE_DIR:-.flatpak-builder}"
 
 # Get version from meson.build
 VERSION=$(grep -oP "version:\s*'\K[^']+" meson.build | head -1)
@@ -92,16 +95,17 @@ if [ -f /run/.containerenv ] || [ -f /.dockerenv ]; then
     fi
 fi
 
-# Step 1: Build the Flatpak
-echo -e "${GREEN}[1/3] Building Flatpak...${NC}"
-flatpak-builder --force-clean "$BUILD_DIR" "$MANIFEST"
-
-# Step 2: Export to repository
-echo -e "${GREEN}[2/3] Exporting to repository...${NC}"
-flatpak-builder --repo="$REPO_DIR" --force-clean "$BUILD_DIR" "$MANIFEST"
-
-# Step 3: Create bundle
-echo -e "${GREEN}[3/3] Creating bundle: ${OUTPUT_FILENAME}${NC}"
+# Step 1: Build the Flatpak and export it to the repository in the same run
+# (a separate export pass would rebuild the whole manifest a second time)
+echo -e "${GREEN}[1/2] Building Flatpak and exporting to repository...${NC}"
+# --ccache keeps object files in the state dir, so a module whose cache
+# entry was invalidated (e.g. cpify itself after a source edit) only
+# recompiles the translation units that actually changed
+flatpak-builder --repo="$REPO_DIR" --force-clean --ccache \
+    --state-dir="$STATE_DIR" "$BUILD_DIR" "$MANIFEST"
+
+# Step 2: Create bundle
+echo -e "${GREEN}[2/2] Creating bundle: ${OUTPUT_FILENAME}${NC}"
 flatpak build-bundle "$REPO_DIR" "$OUTPUT_FILENAME" "$APP_ID"
 
 # Verify bundle was created
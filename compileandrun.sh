@@ -39,9 +39,9 @@ if [[ ! -d "${BUILD_DIR}" ]]; then
 elif [[ ! -f "${BUILD_DIR}/build.ninja" ]]; then
   # Previous setup may have failed (or the directory is incomplete). Wipe and reconfigure.
   meson setup "${BUILD_DIR}" --wipe
-else
-  meson setup "${BUILD_DIR}" --reconfigure
 fi
+# An existing build dir needs no explicit reconfigure: the generated
+# build.ninja re-runs meson by itself whenever a meson.build file changes
 
 meson compile -C "${BUILD_DIR}"
 
@@ -4,6 +4,7 @@
 #include <gst/gst.h>
 #include <math.h>
 #include <stdlib.h>
+#include <string.h>
 
 #include "media_scanner.h"
 #include "player.h"
@@ -13,8 +14,23 @@
 
 #include "updater.h"
 
+// Resolved asset paths keyed by filename (NULL value = not found), so repeated
+// lookups (e.g. logo reloads on theme changes) don't re-probe every search dir
+static GHashTable *asset_path_cache = NULL;
+
 // Helper to find asset file with fallback paths
 char *cpify_find_asset_path(const char *filename) {
+  if (!filename) return NULL;
+
+  if (!asset_path_cache) {
+    asset_path_cache = g_hash_table_new_full(g_str_hash, g_str_equal, g_free, g_free);
+  }
+
+  gpointer cached = NULL;
+  if (g_hash_table_lookup_extended(asset_path_cache, filename, NULL, &cached)) {
+    return g_strdup((const char *)cached);
+  }
+
   const char *search_dirs[] = {
     CPIFY_ASSETS_DIR,
     "assets",
@@ -22,16 +38,18 @@ char *cpify_find_asset_path(const char *filename) {
     "../../assets",
     NULL
   };
-  
+
   for (int i = 0; search_dirs[i] != NULL; i++) {
     char *path = g_build_filename(search_dirs[i], filename, NULL);
     if (g_file_test(path, G_FILE_TEST_EXISTS)) {
       g_print("[ASSETS] Found %s at %s\n", filename, path);
+      g_hash_table_insert(asset_path_cache, g_strdup(filename), g_strdup(path));
       return path;
     }
     g_free(path);
   }
   g_print("[ASSETS] Warning: Could not find asset %s\n", filename);
+  g_hash_table_insert(asset_path_cache, g_strdup(filename), NULL);
   return NULL;
 }
 
@@ -40,6 +58,14 @@ typedef enum {
   LAYOUT_GALLERY
 } CPifyLayout;
 
+// Worker-slot accounting for thumbnail jobs. The app and every job it starts
+// hold a reference, so a job that finishes after a folder switch (or after
+// the window closed) can still hand its slot back.
+typedef struct {
+  CPifyApp *app;    // NULL once the window has closed
+  guint in_flight;  // Jobs started whose completion callback hasn't run yet
+} ThumbnailPool;
+
 struct _CPifyApp {
   AdwApplication *app;
   AdwApplicationWindow *window;
@@ -67,12 +93,16 @@ struct _CPifyApp {
   GtkWidget *sidebar;
   GtkWidget *search_entry;
   GtkWidget *listbox;
+  GPtrArray *list_icons;      // track index -> play icon in its listbox row (NULL if no row)
+  gint lit_icon_track;        // Track whose row currently shows the play icon (-1 = none)
 
   // Gallery layout widgets
   GtkWidget *gallery_layout;
   GtkWidget *gallery_search_entry;
   GtkWidget *gallery_grid;
   GtkWidget *gallery_scroll;
+  gboolean gallery_stale;  // Cards not built for the current tracks; built when the gallery is shown
+  GPtrArray *gallery_placeholders;  // track index -> placeholder icon awaiting a thumbnail
 
   // Video overlay (for gallery fullscreen with minimize)
   GtkWidget *video_overlay;
@@ -88,6 +118,10 @@ struct _CPifyApp {
   GtkWidget *time_label;
   GtkWidget *progress_scale;
   gboolean progress_dragging;
+  gdouble progress_duration;  // Upper bound currently set on progress_scale
+  gint64 track_duration_ns;   // Duration of the loaded track, 0 until known
+  gint time_label_pos;        // Whole seconds currently shown in time_label
+  gint time_label_dur;
 
   // Controls
   GtkWidget *prev_button;
@@ -110,11 +144,25 @@ struct _CPifyApp {
   gchar *current_folder;
   GPtrArray *tracks;
   GArray *visible_tracks;
+  GArray *visible_pos_index;  // track index -> position in visible_tracks (-1 if filtered out)
+  gchar *visible_query;       // lowercased query visible_tracks was built for (NULL = all)
+  guint visible_serial;       // bumped whenever the contents of visible_tracks change
+  guint listbox_serial;       // visible_serial the listbox filter was last applied for
+  guint gallery_serial;       // visible_serial the gallery filter was last applied for
   gint current_track_index;
   gboolean is_playing;
   gboolean is_loading_track;  // Guard to prevent settings reload during track load
 
   guint tick_id;
+  guint speed_apply_id;  // Pending coalesced rate change from the speed slider
+
+  // Folder scan running on a worker thread (NULL when idle)
+  GCancellable *scan_cancellable;
+
+  // Background thumbnail generation (worker pool fed from a queue of track indices)
+  GCancellable *thumb_cancellable;
+  GQueue thumb_queue;
+  ThumbnailPool *thumb_pool;
 
   CPifyPlayer *player;
 };
@@ -122,12 +170,15 @@ struct _CPifyApp {
 // Forward declarations
 static void on_player_eos(gpointer user_data);
 static void play_track_index(CPifyApp *p, gint track_index);
-static void on_search_changed(GtkEditable *editable, gpointer user_data);
+static void on_search_changed(GtkSearchEntry *entry, gpointer user_data);
 static void open_folder_dialog(CPifyApp *p);
 static void switch_to_player_view(CPifyApp *p);
 static void populate_gallery(CPifyApp *p);
 static void switch_layout(CPifyApp *p, CPifyLayout layout);
 static void update_video_for_layout(CPifyApp *p);
+static void pump_thumbnail_queue(CPifyApp *p);
+static gboolean on_tick(gpointer user_data);
+static void on_folder_scanned(GObject *source, GAsyncResult *result, gpointer user_data);
 
 static void switch_to_player_view(CPifyApp *p) {
   if (!p || !p->content_stack) return;
@@ -156,10 +207,24 @@ static void set_status(CPifyApp *p, const gchar *text) {
   gtk_label_set_text(GTK_LABEL(p->status_label), text ? text : "");
 }
 
+// The progress tick only has work to do while media is advancing; run it
+// during playback and let the main loop sleep while paused or stopped
+static void set_progress_ticking(CPifyApp *p, gboolean ticking) {
+  if (!p) return;
+  if (ticking && !p->tick_id) {
+    p->tick_id = g_timeout_add(250, on_tick, p);
+  } else if (!ticking && p->tick_id) {
+    g_source_remove(p->tick_id);
+    p->tick_id = 0;
+  }
+}
+
 static void update_play_button(CPifyApp *p) {
   if (!p || !p->play_pause_button) return;
-  gtk_button_set_icon_name(GTK_BUTTON(p->play_pause_button), 
-    p->is_playing ? "media-playback-pause-symbolic" : "media-playback-start-symbolic");
+  const gchar *icon = p->is_playing ? "media-playback-pause-symbolic" : "media-playback-start-symbolic";
+  // Setting the icon rebuilds the button's image child, so skip it when unchanged
+  if (g_strcmp0(gtk_button_get_icon_name(GTK_BUTTON(p->play_pause_button)), icon) == 0) return;
+  gtk_button_set_icon_name(GTK_BUTTON(p->play_pause_button), icon);
 }
 
 static gboolean get_shuffle(CPifyApp *p) {
@@ -172,12 +237,53 @@ static gboolean get_repeat(CPifyApp *p) {
   return gtk_toggle_button_get_active(GTK_TOGGLE_BUTTON(p->repeat_toggle));
 }
 
-static gchar *format_time_seconds(gdouble seconds) {
+static gint round_time_seconds(gdouble seconds) {
   if (seconds < 0) seconds = 0;
-  gint total = (gint)floor(seconds + 0.5);
-  gint mm = total / 60;
-  gint ss = total % 60;
-  return g_strdup_printf("%02d:%02d", mm, ss);
+  return (gint)floor(seconds + 0.5);
+}
+
+// Largest "MM:SS / MM:SS" text the time label shows, with headroom for
+// tracks longer than 99 minutes
+#define CPIFY_TIME_TEXT_LEN 48
+
+static void format_time_text(gchar *buf, gsize len, gint pos_whole, gint dur_whole) {
+  g_snprintf(buf, len, "%02d:%02d / %02d:%02d",
+             pos_whole / 60, pos_whole % 60, dur_whole / 60, dur_whole % 60);
+}
+
+// Push a position/duration pair into the progress scale and time label
+static void show_progress(CPifyApp *p, gdouble pos_s, gdouble dur_s) {
+  // The duration only changes when a new track loads; re-setting the range
+  // every tick would re-clamp the value and re-emit adjustment signals
+  if (dur_s != p->progress_duration) {
+    gtk_range_set_range(GTK_RANGE(p->progress_scale), 0.0, dur_s);
+    p->progress_duration = dur_s;
+  }
+  if (!p->progress_dragging) {
+    gtk_range_set_value(GTK_RANGE(p->progress_scale), pos_s);
+  }
+
+  // The label shows whole seconds, so three of every four ticks would format
+  // and set identical text; only rebuild it when a displayed value changes
+  gint pos_whole = round_time_seconds(pos_s);
+  gint dur_whole = round_time_seconds(dur_s);
+  if (pos_whole == p->time_label_pos && dur_whole == p->time_label_dur) return;
+  p->time_label_pos = pos_whole;
+  p->time_label_dur = dur_whole;
+
+  // Format both halves in one pass into a stack buffer - no heap strings
+  gchar text[CPIFY_TIME_TEXT_LEN];
+  format_time_text(text, sizeof text, pos_whole, dur_whole);
+  gtk_label_set_text(GTK_LABEL(p->time_label), text);
+}
+
+// Seeks while paused move the position without a running tick to show it.
+// A flushing seek hasn't prerolled yet when the call returns, so a position
+// query would still report the old spot - show the seek target instead.
+static void refresh_progress_if_idle(CPifyApp *p, gdouble target_s) {
+  if (!p || p->tick_id || p->track_duration_ns <= 0) return;
+  gdouble dur_s = (gdouble)p->track_duration_ns / (gdouble)GST_SECOND;
+  show_progress(p, CLAMP(target_s, 0.0, dur_s), dur_s);
 }
 
 static guint visible_len(CPifyApp *p) {
@@ -191,11 +297,31 @@ static gint visible_get_track_index(CPifyApp *p, guint visible_pos) {
 }
 
 static gint visible_find_pos(CPifyApp *p, gint track_index) {
-  if (!p || !p->visible_tracks) return -1;
+  if (!p || !p->visible_pos_index) return -1;
+  if (track_index < 0 || track_index >= (gint)p->visible_pos_index->len) return -1;
+  return g_array_index(p->visible_pos_index, gint, (guint)track_index);
+}
+
+// Rebuild the reverse lookup used by visible_find_pos after visible_tracks changes
+static void visible_rebuild_index(CPifyApp *p) {
+  if (!p) return;
+  if (p->visible_pos_index) {
+    g_array_unref(p->visible_pos_index);
+    p->visible_pos_index = NULL;
+  }
+  if (!p->tracks || !p->visible_tracks) return;
+
+  p->visible_pos_index = g_array_sized_new(FALSE, FALSE, sizeof(gint), p->tracks->len);
+  g_array_set_size(p->visible_pos_index, p->tracks->len);
+  for (guint i = 0; i < p->tracks->len; i++) {
+    g_array_index(p->visible_pos_index, gint, i) = -1;
+  }
   for (guint i = 0; i < p->visible_tracks->len; i++) {
-    if (g_array_index(p->visible_tracks, gint, i) == track_index) return (gint)i;
+    gint idx = g_array_index(p->visible_tracks, gint, i);
+    if (idx >= 0 && idx < (gint)p->tracks->len) {
+      g_array_index(p->visible_pos_index, gint, (guint)idx) = (gint)i;
+    }
   }
-  return -1;
 }
 
 static void clear_listbox(CPifyApp *p) {
@@ -204,48 +330,74 @@ static void clear_listbox(CPifyApp *p) {
   gtk_list_box_remove_all(GTK_LIST_BOX(p->listbox));
 }
 
+static GtkWidget *list_icon_for_track(CPifyApp *p, gint track_index) {
+  if (!p->list_icons || track_index < 0 || track_index >= (gint)p->list_icons->len) return NULL;
+  return g_ptr_array_index(p->list_icons, (guint)track_index);
+}
+
 static void update_list_playing_icons(CPifyApp *p) {
   if (!p || !p->listbox) return;
-  // Iterate using gtk_list_box_get_row_at_index for GTK 4 compatibility
-  for (gint i = 0; ; i++) {
-    GtkListBoxRow *row = gtk_list_box_get_row_at_index(GTK_LIST_BOX(p->listbox), i);
-    if (!row) break;
-    
-    GtkWidget *img = g_object_get_data(G_OBJECT(row), "play-icon");
-    gint idx = GPOINTER_TO_INT(g_object_get_data(G_OBJECT(row), "track-index"));
-    if (img && GTK_IS_IMAGE(img)) {
-      if (idx == p->current_track_index && p->is_playing) {
-        gtk_image_set_from_icon_name(GTK_IMAGE(img), "media-playback-start-symbolic");
-      } else {
-        gtk_image_clear(GTK_IMAGE(img));
-      }
-    }
-  }
+  // At most one row shows the icon, so only the previously lit row and the
+  // newly playing one need touching
+  gint want = (p->is_playing && p->current_track_index >= 0) ? p->current_track_index : -1;
+  if (want == p->lit_icon_track) return;
+
+  GtkWidget *img = list_icon_for_track(p, p->lit_icon_track);
+  if (img) gtk_image_clear(GTK_IMAGE(img));
+  img = list_icon_for_track(p, want);
+  if (img) gtk_image_set_from_icon_name(GTK_IMAGE(img), "media-playback-start-symbolic");
+  p->lit_icon_track = want;
+}
+
+// Only hand new markup to the label when it differs: set_markup re-parses it
+// and invalidates the label's Pango layout even if the text is identical
+static void set_now_playing_markup(CPifyApp *p, const gchar *markup) {
+  if (g_strcmp0(gtk_label_get_label(GTK_LABEL(p->now_playing_label)), markup) == 0) return;
+  gtk_label_set_markup(GTK_LABEL(p->now_playing_label), markup);
 }
 
 static void set_now_playing(CPifyApp *p, const gchar *title) {
   if (!p || !p->now_playing_label) return;
   if (!title || title[0] == '\0') {
-    gtk_label_set_markup(GTK_LABEL(p->now_playing_label), 
-      "<span size='x-large' weight='bold'>Choose a song</span>");
+    set_now_playing_markup(p, "<span size='x-large' weight='bold'>Choose a song</span>");
     return;
   }
   gchar *escaped = g_markup_escape_text(title, -1);
   gchar *markup = g_strdup_printf("<span size='x-large' weight='bold'>%s</span>", escaped);
-  gtk_label_set_markup(GTK_LABEL(p->now_playing_label), markup);
+  set_now_playing_markup(p, markup);
   g_free(markup);
   g_free(escaped);
 }
 
+// Rows are built once per folder (row N is track N); searching only hides rows
+static gboolean listbox_filter(GtkListBoxRow *row, gpointer user_data) {
+  CPifyApp *p = (CPifyApp *)user_data;
+  gint track_index = GPOINTER_TO_INT(g_object_get_data(G_OBJECT(row), "track-index"));
+  return visible_find_pos(p, track_index) >= 0;
+}
+
+static void refilter_listbox(CPifyApp *p) {
+  if (!p || !p->listbox) return;
+  p->listbox_serial = p->visible_serial;
+  gtk_list_box_invalidate_filter(GTK_LIST_BOX(p->listbox));
+}
+
 static void populate_listbox(CPifyApp *p) {
   if (!p) return;
+  p->listbox_serial = p->visible_serial;
   clear_listbox(p);
+  if (p->list_icons) {
+    g_ptr_array_unref(p->list_icons);
+    p->list_icons = NULL;
+  }
+  p->lit_icon_track = -1;
   if (!p->tracks || !p->visible_tracks || !p->listbox) return;
+  p->list_icons = g_ptr_array_new();
+  g_ptr_array_set_size(p->list_icons, (gint)p->tracks->len);
 
-  for (guint i = 0; i < p->visible_tracks->len; i++) {
-    gint track_index = visible_get_track_index(p, i);
-    if (track_index < 0 || track_index >= (gint)p->tracks->len) continue;
-    CPifyTrack *t = g_ptr_array_index(p->tracks, (guint)track_index);
+  for (guint i = 0; i < p->tracks->len; i++) {
+    gint track_index = (gint)i;
+    CPifyTrack *t = g_ptr_array_index(p->tracks, i);
 
     GtkWidget *row = gtk_list_box_row_new();
     g_object_set_data(G_OBJECT(row), "track-index", GINT_TO_POINTER(track_index));
@@ -258,7 +410,7 @@ static void populate_listbox(CPifyApp *p) {
 
     GtkWidget *icon = gtk_image_new();
     gtk_widget_set_size_request(icon, 18, -1);
-    g_object_set_data(G_OBJECT(row), "play-icon", icon);
+    g_ptr_array_index(p->list_icons, (guint)track_index) = icon;
 
     GtkWidget *label = gtk_label_new(t && t->title ? t->title : "(unknown)");
     gtk_label_set_xalign(GTK_LABEL(label), 0.0f);
@@ -276,54 +428,84 @@ static void populate_listbox(CPifyApp *p) {
 
 static void visible_reset_all(CPifyApp *p) {
   if (!p) return;
+  g_free(p->visible_query);
+  p->visible_query = NULL;
   if (p->visible_tracks) {
     g_array_unref(p->visible_tracks);
     p->visible_tracks = NULL;
   }
   p->visible_tracks = g_array_new(FALSE, FALSE, sizeof(gint));
-  if (!p->tracks) return;
-  for (guint i = 0; i < p->tracks->len; i++) {
-    gint idx = (gint)i;
-    g_array_append_val(p->visible_tracks, idx);
+  if (p->tracks) {
+    for (guint i = 0; i < p->tracks->len; i++) {
+      gint idx = (gint)i;
+      g_array_append_val(p->visible_tracks, idx);
+    }
   }
+  visible_rebuild_index(p);
+  p->visible_serial++;
 }
 
 static void visible_apply_search(CPifyApp *p, const gchar *query) {
-  visible_reset_all(p);
-  if (!p || !p->tracks || !p->visible_tracks) return;
-  if (!query) return;
-  gchar *q = g_utf8_strdown(query, -1);
-  if (!q || q[0] == '\0') {
+  if (!p) return;
+  gchar *q = query ? g_utf8_strdown(query, -1) : NULL;
+  if (q && q[0] == '\0') {
+    g_free(q);
+    q = NULL;
+  }
+
+  // Same query over the same track list - the current result still holds
+  if (p->visible_tracks && g_strcmp0(q, p->visible_query) == 0) {
     g_free(q);
     return;
   }
 
   GArray *filtered = g_array_new(FALSE, FALSE, sizeof(gint));
-  for (guint i = 0; i < p->tracks->len; i++) {
-    CPifyTrack *t = g_ptr_array_index(p->tracks, i);
-    const gchar *title = (t && t->title) ? t->title : "";
-    gchar *lower = g_utf8_strdown(title, -1);
-    gboolean match = (lower && g_strstr_len(lower, -1, q) != NULL);
-    g_free(lower);
-    if (match) {
-      gint idx = (gint)i;
-      g_array_append_val(filtered, idx);
+  if (q && p->tracks && p->visible_query && p->visible_tracks &&
+      g_str_has_prefix(q, p->visible_query)) {
+    // The query only grew (the usual case while typing): anything matching it
+    // also matched the previous query, so narrow the previous result instead
+    // of rescanning the whole library
+    for (guint i = 0; i < p->visible_tracks->len; i++) {
+      gint idx = g_array_index(p->visible_tracks, gint, i);
+      CPifyTrack *t = g_ptr_array_index(p->tracks, (guint)idx);
+      if (t && t->search_key && strstr(t->search_key, q) != NULL) {
+        g_array_append_val(filtered, idx);
+      }
     }
+  } else {
+    for (guint i = 0; p->tracks && i < p->tracks->len; i++) {
+      CPifyTrack *t = g_ptr_array_index(p->tracks, i);
+      if (!q || (t && t->search_key && strstr(t->search_key, q) != NULL)) {
+        gint idx = (gint)i;
+        g_array_append_val(filtered, idx);
+      }
+    }
+  }
+
+  g_free(p->visible_query);
+  p->visible_query = q;
+
+  // A different query often matches the same tracks (e.g. typing further
+  // into a unique title); keep the old result so the views aren't rebuilt
+  if (p->visible_tracks && p->visible_tracks->len == filtered->len &&
+      memcmp(p->visible_tracks->data, filtered->data, filtered->len * sizeof(gint)) == 0) {
+    g_array_unref(filtered);
+    return;
   }
-  g_free(q);
 
-  g_array_unref(p->visible_tracks);
+  if (p->visible_tracks) g_array_unref(p->visible_tracks);
   p->visible_tracks = filtered;
+  visible_rebuild_index(p);
+  p->visible_serial++;
 }
 
 // ============ Gallery Layout Functions ============
 
 static void clear_gallery(CPifyApp *p) {
   if (!p || !p->gallery_grid) return;
-  GtkWidget *child;
-  while ((child = gtk_widget_get_first_child(p->gallery_grid)) != NULL) {
-    gtk_flow_box_remove(GTK_FLOW_BOX(p->gallery_grid), child);
-  }
+  // Like the list box, drop every card in one pass rather than one
+  // remove (and one child re-layout) per track
+  gtk_flow_box_remove_all(GTK_FLOW_BOX(p->gallery_grid));
 }
 
 static void on_gallery_item_activated(GtkFlowBox *box, GtkFlowBoxChild *child, gpointer user_data) {
@@ -334,82 +516,50 @@ static void on_gallery_item_activated(GtkFlowBox *box, GtkFlowBoxChild *child, g
   play_track_index(p, track_index);
 }
 
-// Async thumbnail generation data
-typedef struct {
-  CPifyApp *app;
-  gint track_index;
-  GtkWidget *thumb_widget;
-} AsyncThumbData;
-
-static gboolean update_thumbnail_when_ready(gpointer user_data) {
-  AsyncThumbData *data = (AsyncThumbData *)user_data;
-  if (!data || !data->app || !data->thumb_widget) {
-    g_free(data);
-    return G_SOURCE_REMOVE;
-  }
-  
-  CPifyApp *p = data->app;
-  if (!p->tracks || data->track_index < 0 || data->track_index >= (gint)p->tracks->len) {
-    g_free(data);
-    return G_SOURCE_REMOVE;
-  }
-  
-  CPifyTrack *t = g_ptr_array_index(p->tracks, (guint)data->track_index);
-  
-  // Check if thumbnail is ready
-  if (t && t->thumbnail && GTK_IS_WIDGET(data->thumb_widget)) {
-    // Update the widget with the thumbnail
-    GdkTexture *texture = gdk_texture_new_for_pixbuf(t->thumbnail);
-    GtkWidget *new_thumb = gtk_picture_new_for_paintable(GDK_PAINTABLE(texture));
-    gtk_picture_set_content_fit(GTK_PICTURE(new_thumb), GTK_CONTENT_FIT_COVER);
-    gtk_widget_set_size_request(new_thumb, 160, 100);
-    gtk_widget_set_hexpand(new_thumb, TRUE);
-    gtk_widget_set_vexpand(new_thumb, TRUE);
-    gtk_widget_set_valign(new_thumb, GTK_ALIGN_CENTER);
-    gtk_widget_set_halign(new_thumb, GTK_ALIGN_CENTER);
-    
-    // Replace the old widget
-    GtkWidget *parent = gtk_widget_get_parent(data->thumb_widget);
-    if (parent && GTK_IS_BOX(parent)) {
-      g_object_ref(data->thumb_widget);
-      gtk_box_remove(GTK_BOX(parent), data->thumb_widget);
-      gtk_box_prepend(GTK_BOX(parent), new_thumb);
-      g_object_unref(data->thumb_widget);
-    }
-    
-    g_object_unref(texture);
-    g_free(data);
-    return G_SOURCE_REMOVE;
-  }
+static void request_thumbnail_async(CPifyApp *p, CPifyTrack *t) {
+  if (!t || !t->is_video || t->thumbnail) return;
   
-  // Not ready yet, check again
-  return G_SOURCE_CONTINUE;
+  // Make sure the background workers are running (the track was queued by
+  // start_thumbnail_generation when the folder was loaded). The card is
+  // refreshed by on_thumbnail_ready when the frame arrives - nothing polls.
+  pump_thumbnail_queue(p);
 }
 
-static void request_thumbnail_async(CPifyApp *p, CPifyTrack *t, gint track_index, GtkWidget *thumb_widget) {
-  if (!t || !t->is_video || t->thumbnail) return;
-  
-  // Start async thumbnail generation
-  g_idle_add_full(G_PRIORITY_LOW, (GSourceFunc)cpify_track_generate_thumbnail, t, NULL);
-  
-  // Set up polling to update when ready
-  AsyncThumbData *data = g_new0(AsyncThumbData, 1);
-  data->app = p;
-  data->track_index = track_index;
-  data->thumb_widget = thumb_widget;
-  
-  g_timeout_add(100, update_thumbnail_when_ready, data);
+// Cards are built once per folder (child N is track N); searching only hides them
+static gboolean gallery_filter(GtkFlowBoxChild *child, gpointer user_data) {
+  CPifyApp *p = (CPifyApp *)user_data;
+  gint track_index = GPOINTER_TO_INT(g_object_get_data(G_OBJECT(child), "track-index"));
+  return visible_find_pos(p, track_index) >= 0;
+}
+
+static void refilter_gallery(CPifyApp *p) {
+  if (!p || !p->gallery_grid) return;
+  p->gallery_serial = p->visible_serial;
+  gtk_flow_box_invalidate_filter(GTK_FLOW_BOX(p->gallery_grid));
 }
 
 static void populate_gallery(CPifyApp *p) {
   if (!p) return;
+  p->gallery_serial = p->visible_serial;
   clear_gallery(p);
+  if (p->gallery_placeholders) {
+    g_ptr_array_unref(p->gallery_placeholders);
+    p->gallery_placeholders = NULL;
+  }
+  // Building cards (and kicking off thumbnail loads) for a hidden gallery is
+  // wasted work - defer it until switch_layout actually shows the gallery
+  if (p->current_layout != LAYOUT_GALLERY) {
+    p->gallery_stale = TRUE;
+    return;
+  }
+  p->gallery_stale = FALSE;
   if (!p->tracks || !p->visible_tracks || !p->gallery_grid) return;
+  p->gallery_placeholders = g_ptr_array_new();
+  g_ptr_array_set_size(p->gallery_placeholders, (gint)p->tracks->len);
 
-  for (guint i = 0; i < p->visible_tracks->len; i++) {
-    gint track_index = visible_get_track_index(p, i);
-    if (track_index < 0 || track_index >= (gint)p->tracks->len) continue;
-    CPifyTrack *t = g_ptr_array_index(p->tracks, (guint)track_index);
+  for (guint i = 0; i < p->tracks->len; i++) {
+    gint track_index = (gint)i;
+    CPifyTrack *t = g_ptr_array_index(p->tracks, i);
 
     // Create a card-like item for the gallery
     GtkWidget *item = gtk_box_new(GTK_ORIENTATION_VERTICAL, 8);
@@ -423,12 +573,11 @@ static void populate_gallery(CPifyApp *p) {
     // Thumbnail - show placeholder first, load async if needed
     GtkWidget *thumb;
     if (t && t->thumbnail) {
-      // Thumbnail already loaded
-      GdkTexture *texture = gdk_texture_new_for_pixbuf(t->thumbnail);
+      // Thumbnail already loaded - reuse the track's cached texture
+      GdkTexture *texture = cpify_track_get_texture(t);
       thumb = gtk_picture_new_for_paintable(GDK_PAINTABLE(texture));
       gtk_picture_set_content_fit(GTK_PICTURE(thumb), GTK_CONTENT_FIT_COVER);
       gtk_widget_set_size_request(thumb, 160, 100);
-      g_object_unref(texture);
     } else {
       // Show placeholder icon, request async thumbnail if it's a video
       const char *icon_name = (t && t->is_video) ? 
@@ -439,7 +588,8 @@ static void populate_gallery(CPifyApp *p) {
       
       // Request async thumbnail generation for videos
       if (t && t->is_video) {
-        request_thumbnail_async(p, t, track_index, thumb);
+        g_ptr_array_index(p->gallery_placeholders, (guint)track_index) = thumb;
+        request_thumbnail_async(p, t);
       }
     }
     gtk_widget_set_hexpand(thumb, TRUE);
@@ -470,11 +620,41 @@ static void populate_gallery(CPifyApp *p) {
   }
 }
 
-static void on_gallery_search_changed(GtkEditable *editable, gpointer user_data) {
+// Swap a card's placeholder icon for its freshly generated thumbnail, leaving
+// the rest of the gallery untouched
+static void gallery_update_thumbnail(CPifyApp *p, gint track_index) {
+  if (!p->gallery_placeholders || track_index < 0 ||
+      track_index >= (gint)p->gallery_placeholders->len) return;
+  GtkWidget *placeholder = g_ptr_array_index(p->gallery_placeholders, (guint)track_index);
+  if (!placeholder) return;
+  g_ptr_array_index(p->gallery_placeholders, (guint)track_index) = NULL;
+
+  CPifyTrack *t = g_ptr_array_index(p->tracks, (guint)track_index);
+  GtkWidget *parent = gtk_widget_get_parent(placeholder);
+  GdkTexture *texture = cpify_track_get_texture(t);
+  if (!texture || !parent || !GTK_IS_BOX(parent)) return;
+
+  GtkWidget *thumb = gtk_picture_new_for_paintable(GDK_PAINTABLE(texture));
+  gtk_picture_set_content_fit(GTK_PICTURE(thumb), GTK_CONTENT_FIT_COVER);
+  gtk_widget_set_size_request(thumb, 160, 100);
+  gtk_widget_set_hexpand(thumb, TRUE);
+  gtk_widget_set_vexpand(thumb, TRUE);
+  gtk_widget_set_valign(thumb, GTK_ALIGN_CENTER);
+  gtk_widget_set_halign(thumb, GTK_ALIGN_CENTER);
+
+  gtk_box_remove(GTK_BOX(parent), placeholder);
+  gtk_box_prepend(GTK_BOX(parent), thumb);
+}
+
+static void on_gallery_search_changed(GtkSearchEntry *entry, gpointer user_data) {
   CPifyApp *p = (CPifyApp *)user_data;
-  const gchar *q = gtk_editable_get_text(editable);
+  const gchar *q = gtk_editable_get_text(GTK_EDITABLE(entry));
   visible_apply_search(p, q);
-  populate_gallery(p);
+  if (p->gallery_stale) {
+    populate_gallery(p);
+  } else if (p->gallery_serial != p->visible_serial) {
+    refilter_gallery(p);
+  }
 }
 
 static void on_video_minimize_clicked(GtkButton *btn, gpointer user_data) {
@@ -522,12 +702,20 @@ static void switch_layout(CPifyApp *p, CPifyLayout layout) {
   } else {
     gtk_stack_set_visible_child_name(GTK_STACK(p->layout_stack), "gallery");
     gtk_widget_set_visible(p->sidebar_toggle, FALSE);
-    // Sync search and populate gallery
+    // Sync search and populate gallery once. The gallery entry's
+    // search-changed arrives after a delay for non-empty text (immediately
+    // for empty), but it carries the same query, so visible_apply_search
+    // returns early and the serial checks leave the gallery as built here
     if (p->search_entry && p->gallery_search_entry) {
       const gchar *q = gtk_editable_get_text(GTK_EDITABLE(p->search_entry));
       gtk_editable_set_text(GTK_EDITABLE(p->gallery_search_entry), q);
+      visible_apply_search(p, q);
+    }
+    if (p->gallery_stale) {
+      populate_gallery(p);
+    } else if (p->gallery_serial != p->visible_serial) {
+      refilter_gallery(p);
     }
-    populate_gallery(p);
   }
   
   // Update video widget position for the new layout
@@ -739,13 +927,12 @@ static void play_track_index(CPifyApp *p, gint track_index) {
   CPifyTrack *t = g_ptr_array_index(p->tracks, (guint)track_index);
   if (!t || !t->path) return;
 
-  // Stop current playback before loading new track
-  cpify_player_stop(p->player);
-
   // Set guard to prevent settings callbacks from reloading during init
   p->is_loading_track = TRUE;
-  init_player_settings(p);
 
+  // set_path takes the pipeline down to NULL itself before swapping the URI,
+  // so there is no separate stop; settings are applied after it so the rate
+  // change doesn't flush-seek the outgoing track
   GError *err = NULL;
   if (!cpify_player_set_path(p->player, t->path, &err)) {
     p->is_loading_track = FALSE;
@@ -755,20 +942,22 @@ static void play_track_index(CPifyApp *p, gint track_index) {
     if (err) g_error_free(err);
     return;
   }
+  init_player_settings(p);
 
   p->current_track_index = track_index;
+  p->track_duration_ns = 0;
   p->is_playing = TRUE;
   p->is_loading_track = FALSE;  // Clear guard after track is loaded
   
   update_play_button(p);
   set_now_playing(p, t->title ? t->title : t->path);
   cpify_player_play(p->player);
+  set_progress_ticking(p, TRUE);
 
   update_list_playing_icons(p);
 
-  gint visible_pos = visible_find_pos(p, track_index);
-  if (visible_pos >= 0) {
-    GtkListBoxRow *row = gtk_list_box_get_row_at_index(GTK_LIST_BOX(p->listbox), visible_pos);
+  if (visible_find_pos(p, track_index) >= 0) {
+    GtkListBoxRow *row = gtk_list_box_get_row_at_index(GTK_LIST_BOX(p->listbox), track_index);
     if (row) gtk_list_box_select_row(GTK_LIST_BOX(p->listbox), row);
   }
   
@@ -790,17 +979,18 @@ static gint choose_next_visible_pos(CPifyApp *p) {
   }
 
   if (n == 1) return 0;
-  for (gint attempts = 0; attempts < 12; attempts++) {
-    gint idx = (gint)g_random_int_range(0, (gint)n);
-    if (idx != cur_pos) return idx;
-  }
-  return (cur_pos + 1) % (gint)n;
+  if (cur_pos < 0) return (gint)g_random_int_range(0, (gint)n);
+  // Draw uniformly from the other n - 1 positions and step over the current
+  // one: a single draw, no retry loop and no bias toward cur_pos + 1
+  gint idx = (gint)g_random_int_range(0, (gint)n - 1);
+  return (idx >= cur_pos) ? idx + 1 : idx;
 }
 
 static void play_next(CPifyApp *p) {
   gint next_pos = choose_next_visible_pos(p);
   if (next_pos < 0) {
     p->is_playing = FALSE;
+    set_progress_ticking(p, FALSE);
     update_play_button(p);
     if (p->player) cpify_player_stop(p->player);
     set_status(p, "Reached end of list.");
@@ -830,55 +1020,146 @@ static void on_player_eos(gpointer user_data) {
   play_next(p);
 }
 
-// Thumbnail generation state
+// Max number of thumbnails extracted in parallel on worker threads
+#define CPIFY_THUMBNAIL_WORKERS 4
+
 typedef struct {
-  CPifyApp *app;
-  guint current_index;
-} ThumbnailGenState;
+  gchar *path;
+  gint track_index;
+  GdkTexture *texture;  // Built on the worker alongside the pixbuf
+} ThumbnailJob;
+
+static void thumbnail_job_free(gpointer data) {
+  ThumbnailJob *job = (ThumbnailJob *)data;
+  if (!job) return;
+  g_free(job->path);
+  g_clear_object(&job->texture);
+  g_free(job);
+}
+
+static void thumbnail_thread(GTask *task, gpointer source_object, gpointer task_data,
+                             GCancellable *cancellable) {
+  (void)source_object;
+  ThumbnailJob *job = (ThumbnailJob *)task_data;
+  if (g_cancellable_is_cancelled(cancellable)) {
+    g_task_return_new_error(task, G_IO_ERROR, G_IO_ERROR_CANCELLED, "Cancelled");
+    return;
+  }
+  GdkPixbuf *pixbuf = cpify_generate_thumbnail_for_path(job->path, cancellable);
+  if (g_task_return_error_if_cancelled(task)) {
+    if (pixbuf) g_object_unref(pixbuf);
+    return;
+  }
+  // Upload to a texture here too, so the first gallery card showing this
+  // thumbnail doesn't pay the pixbuf -> texture copy on the main thread
+  if (pixbuf) job->texture = gdk_texture_new_for_pixbuf(pixbuf);
+  g_task_return_pointer(task, pixbuf, g_object_unref);
+}
 
-static gboolean generate_next_thumbnail(gpointer user_data) {
-  ThumbnailGenState *state = (ThumbnailGenState *)user_data;
-  if (!state || !state->app || !state->app->tracks) {
-    g_free(state);
-    return G_SOURCE_REMOVE;
+static void on_thumbnail_ready(GObject *source, GAsyncResult *result, gpointer user_data) {
+  (void)source;
+  GError *err = NULL;
+  GdkPixbuf *pixbuf = g_task_propagate_pointer(G_TASK(result), &err);
+  gboolean cancelled = FALSE;
+  if (err) {
+    cancelled = g_error_matches(err, G_IO_ERROR, G_IO_ERROR_CANCELLED);
+    g_error_free(err);
   }
-  
-  CPifyApp *p = state->app;
-  
-  // Find next video track without thumbnail
-  while (state->current_index < p->tracks->len) {
-    CPifyTrack *t = g_ptr_array_index(p->tracks, state->current_index);
-    state->current_index++;
-    
-    if (t && t->is_video && !t->thumbnail) {
-      // Generate thumbnail for this track
-      cpify_track_generate_thumbnail(t);
-      
-      // Refresh gallery if visible
-      if (p->current_layout == LAYOUT_GALLERY) {
-        populate_gallery(p);
+
+  // The slot is only free now that the worker has actually returned
+  ThumbnailPool *pool = (ThumbnailPool *)user_data;
+  if (pool->in_flight > 0) pool->in_flight--;
+  CPifyApp *p = pool->app;
+  g_rc_box_release(pool);
+  if (!p) {
+    // Window closed; the app state this job was started for is gone
+    if (pixbuf) g_object_unref(pixbuf);
+    return;
+  }
+  if (cancelled) {
+    // Job from a previous folder: its track index means nothing now, but
+    // the freed slot may let the current folder's queue move on
+    pump_thumbnail_queue(p);
+    return;
+  }
+
+  ThumbnailJob *job = g_task_get_task_data(G_TASK(result));
+  if (pixbuf && p->tracks && job->track_index < (gint)p->tracks->len) {
+    CPifyTrack *t = g_ptr_array_index(p->tracks, (guint)job->track_index);
+    if (t && !t->thumbnail) {
+      t->thumbnail = pixbuf;
+      pixbuf = NULL;
+      if (!t->texture) {
+        t->texture = job->texture;
+        job->texture = NULL;
       }
-      
-      // Continue on next idle
-      return G_SOURCE_CONTINUE;
+      // Update just this card; if the gallery hasn't been built yet it will
+      // pick the thumbnail up when it is
+      gallery_update_thumbnail(p, job->track_index);
     }
   }
-  
-  // All done
-  g_print("[DEBUG] Thumbnail generation complete\n");
-  g_free(state);
-  return G_SOURCE_REMOVE;
+  if (pixbuf) g_object_unref(pixbuf);
+
+  pump_thumbnail_queue(p);
+  if (p->thumb_pool->in_flight == 0) {
+    g_print("[DEBUG] Thumbnail generation complete\n");
+  }
+}
+
+static void pump_thumbnail_queue(CPifyApp *p) {
+  if (!p || !p->tracks || !p->thumb_cancellable || !p->thumb_pool) return;
+
+  // in_flight still counts cancelled jobs that are winding down, so a quick
+  // folder switch never runs more than CPIFY_THUMBNAIL_WORKERS decoders
+  while (p->thumb_pool->in_flight < CPIFY_THUMBNAIL_WORKERS && !g_queue_is_empty(&p->thumb_queue)) {
+    gint track_index = GPOINTER_TO_INT(g_queue_pop_head(&p->thumb_queue));
+    if (track_index < 0 || track_index >= (gint)p->tracks->len) continue;
+    CPifyTrack *t = g_ptr_array_index(p->tracks, (guint)track_index);
+    if (!t || !t->is_video || t->thumbnail || !t->path) continue;
+
+    ThumbnailJob *job = g_new0(ThumbnailJob, 1);
+    job->path = g_strdup(t->path);
+    job->track_index = track_index;
+
+    GTask *task = g_task_new(NULL, p->thumb_cancellable, on_thumbnail_ready,
+                             g_rc_box_acquire(p->thumb_pool));
+    g_task_set_task_data(task, job, thumbnail_job_free);
+    g_task_run_in_thread(task, thumbnail_thread);
+    g_object_unref(task);
+    p->thumb_pool->in_flight++;
+  }
+}
+
+static void stop_thumbnail_generation(CPifyApp *p) {
+  if (!p) return;
+  if (p->thumb_cancellable) {
+    g_cancellable_cancel(p->thumb_cancellable);
+    g_object_unref(p->thumb_cancellable);
+    p->thumb_cancellable = NULL;
+  }
+  // Running jobs keep their slots until their callbacks arrive
+  g_queue_clear(&p->thumb_queue);
 }
 
 static void start_thumbnail_generation(CPifyApp *p) {
   if (!p || !p->tracks) return;
   
-  ThumbnailGenState *state = g_new0(ThumbnailGenState, 1);
-  state->app = p;
-  state->current_index = 0;
+  stop_thumbnail_generation(p);
+  p->thumb_cancellable = g_cancellable_new();
+  if (!p->thumb_pool) {
+    p->thumb_pool = g_rc_box_new0(ThumbnailPool);
+    p->thumb_pool->app = p;
+  }
+  
+  for (guint i = 0; i < p->tracks->len; i++) {
+    CPifyTrack *t = g_ptr_array_index(p->tracks, i);
+    if (t && t->is_video && !t->thumbnail) {
+      g_queue_push_tail(&p->thumb_queue, GINT_TO_POINTER((gint)i));
+    }
+  }
   
-  // Use low priority idle to not block UI
-  g_idle_add_full(G_PRIORITY_LOW, generate_next_thumbnail, state, NULL);
+  // Extraction runs on worker threads so the UI never blocks on a decoder
+  pump_thumbnail_queue(p);
 }
 
 static void load_folder(CPifyApp *p, const gchar *folder) {
@@ -894,26 +1175,64 @@ static void load_folder(CPifyApp *p, const gchar *folder) {
   settings->last_folder = g_strdup(folder);
   cpify_settings_save();
 
+  // Drop in-flight thumbnail jobs and any unfinished scan for the old folder
+  stop_thumbnail_generation(p);
+  if (p->scan_cancellable) {
+    g_cancellable_cancel(p->scan_cancellable);
+    g_clear_object(&p->scan_cancellable);
+  }
+
   if (p->tracks) {
     g_ptr_array_unref(p->tracks);
     p->tracks = NULL;
   }
 
+  // The old rows and cards index into the track list just freed; empty the
+  // views and playback state now rather than when the scan comes back
+  visible_reset_all(p);
+  populate_listbox(p);
+  populate_gallery(p);
+
+  p->current_track_index = -1;
+  p->is_playing = FALSE;
+  set_progress_ticking(p, FALSE);
+  update_play_button(p);
+  set_now_playing(p, NULL);
+  update_list_playing_icons(p);
+
   set_status(p, "Scanning folder…");
 
+  // Walking a large tree is slow disk I/O; keep it off the UI thread
   g_print("[DEBUG] load_folder: scanning...\n");
+  p->scan_cancellable = g_cancellable_new();
+  cpify_scan_folder_async(folder, p->scan_cancellable, on_folder_scanned, p);
+}
+
+static void on_folder_scanned(GObject *source, GAsyncResult *result, gpointer user_data) {
+  (void)source;
   GError *err = NULL;
-  p->tracks = cpify_scan_folder(folder, &err);
-  if (!p->tracks) {
+  GPtrArray *tracks = cpify_scan_folder_finish(result, &err);
+  if (!tracks && g_error_matches(err, G_IO_ERROR, G_IO_ERROR_CANCELLED)) {
+    // Superseded by another folder (or the window closed) - leave p alone
+    g_error_free(err);
+    return;
+  }
+
+  CPifyApp *p = (CPifyApp *)user_data;
+  g_clear_object(&p->scan_cancellable);
+  if (!tracks) {
     gchar *msg = g_strdup_printf("Scan failed: %s", err ? err->message : "unknown error");
     show_toast(p, msg);
+    set_status(p, "Scan failed.");
     g_free(msg);
     if (err) g_error_free(err);
     return;
   }
+  p->tracks = tracks;
   g_print("[DEBUG] load_folder: found %u tracks\n", p->tracks->len);
 
-  // Block search signal while we update the entries
+  // Clearing a GtkSearchEntry emits search-changed synchronously (only
+  // non-empty text is delayed), so blocking the handlers here does suppress it
   g_print("[DEBUG] load_folder: clearing search entries...\n");
   if (p->search_entry) {
     g_signal_handlers_block_by_func(p->search_entry, on_search_changed, p);
@@ -933,14 +1252,6 @@ static void load_folder(CPifyApp *p, const gchar *folder) {
   populate_listbox(p);
   populate_gallery(p);
 
-  p->current_track_index = -1;
-  p->is_playing = FALSE;
-  
-  g_print("[DEBUG] load_folder: updating UI...\n");
-  update_play_button(p);
-  set_now_playing(p, NULL);
-  update_list_playing_icons(p);
-
   gchar *status = g_strdup_printf("Loaded %u media file(s)", p->tracks->len);
   set_status(p, status);
   g_free(status);
@@ -965,20 +1276,17 @@ static void on_folder_selected(GObject *source, GAsyncResult *result, gpointer u
     if (path) {
       load_folder(p, path);
       g_free(path);
-      // Only switch to player view if folder was loaded successfully
-      if (from_splash && p->tracks && p->tracks->len > 0) {
-        switch_to_player_view(p);
-      } else if (from_splash) {
-        // Folder had no media - still switch but show message
-        switch_to_player_view(p);
-      }
+      // The scan reports its own progress and result in the player view
+      if (from_splash) switch_to_player_view(p);
     }
     g_object_unref(folder);
-  } else if (error && !g_error_matches(error, GTK_DIALOG_ERROR, GTK_DIALOG_ERROR_DISMISSED)) {
-    show_toast(p, error->message);
+  } else if (error) {
+    // If dialog was dismissed and we came from splash, stay on splash
+    if (!g_error_matches(error, GTK_DIALOG_ERROR, GTK_DIALOG_ERROR_DISMISSED)) {
+      show_toast(p, error->message);
+    }
     g_error_free(error);
   }
-  // If dialog was dismissed and we came from splash, stay on splash
 }
 
 static void open_folder_dialog(CPifyApp *p) {
@@ -1031,12 +1339,13 @@ static void on_row_activated(GtkListBox *box, GtkListBoxRow *row, gpointer user_
   play_track_index(p, track_index);
 }
 
-static void on_search_changed(GtkEditable *editable, gpointer user_data) {
+static void on_search_changed(GtkSearchEntry *entry, gpointer user_data) {
   CPifyApp *p = (CPifyApp *)user_data;
-  const gchar *q = gtk_editable_get_text(editable);
+  const gchar *q = gtk_editable_get_text(GTK_EDITABLE(entry));
   visible_apply_search(p, q);
-  populate_listbox(p);
-  update_list_playing_icons(p);
+  if (p->listbox_serial != p->visible_serial) {
+    refilter_listbox(p);
+  }
 }
 
 static void on_play_pause_clicked(GtkButton *btn, gpointer user_data) {
@@ -1060,6 +1369,7 @@ static void on_play_pause_clicked(GtkButton *btn, gpointer user_data) {
     p->is_playing = TRUE;
     cpify_player_play(p->player);
   }
+  set_progress_ticking(p, p->is_playing);
   update_play_button(p);
   update_list_playing_icons(p);
 }
@@ -1081,7 +1391,10 @@ static void on_skip_back_clicked(GtkButton *btn, gpointer user_data) {
   cpify_play_click_sound();
   CPifyApp *p = (CPifyApp *)user_data;
   if (!p || !p->player || p->current_track_index < 0) return;
-  cpify_player_seek_relative(p->player, -10.0);
+  gdouble target = 0.0;
+  if (cpify_player_seek_relative(p->player, -10.0, &target)) {
+    refresh_progress_if_idle(p, target);
+  }
 }
 
 static void on_skip_forward_clicked(GtkButton *btn, gpointer user_data) {
@@ -1089,7 +1402,10 @@ static void on_skip_forward_clicked(GtkButton *btn, gpointer user_data) {
   cpify_play_click_sound();
   CPifyApp *p = (CPifyApp *)user_data;
   if (!p || !p->player || p->current_track_index < 0) return;
-  cpify_player_seek_relative(p->player, 10.0);
+  gdouble target = 0.0;
+  if (cpify_player_seek_relative(p->player, 10.0, &target)) {
+    refresh_progress_if_idle(p, target);
+  }
 }
 
 static void on_settings_clicked(GtkButton *btn, gpointer user_data) {
@@ -1127,7 +1443,9 @@ static void on_progress_drag_end(GtkGestureDrag *gesture, gdouble x, gdouble y,
   p->progress_dragging = FALSE;
   if (!p->player || p->current_track_index < 0) return;
   gdouble seconds = gtk_range_get_value(GTK_RANGE(p->progress_scale));
-  cpify_player_seek_to(p->player, seconds);
+  if (cpify_player_seek_to(p->player, seconds)) {
+    refresh_progress_if_idle(p, seconds);
+  }
 }
 
 static void on_volume_changed(GtkRange *range, gpointer user_data) {
@@ -1140,9 +1458,23 @@ static void on_volume_changed(GtkRange *range, gpointer user_data) {
   cpify_settings_save();
 }
 
-static void on_speed_changed(GtkRange *range, gpointer user_data) {
+// Delay before a speed slider change is applied to the pipeline
+#define CPIFY_SPEED_APPLY_DELAY_MS 50
+
+static gboolean apply_speed_timeout(gpointer user_data) {
   CPifyApp *p = (CPifyApp *)user_data;
+  p->speed_apply_id = 0;
   apply_speed_setting(p);
+  return G_SOURCE_REMOVE;
+}
+
+static void on_speed_changed(GtkRange *range, gpointer user_data) {
+  CPifyApp *p = (CPifyApp *)user_data;
+  // Every rate change is a flushing seek, so dragging the slider would
+  // queue one per motion event; apply only the latest value instead
+  if (!p->speed_apply_id) {
+    p->speed_apply_id = g_timeout_add(CPIFY_SPEED_APPLY_DELAY_MS, apply_speed_timeout, p);
+  }
   
   // Save to settings
   CPifySettings *settings = cpify_settings_get();
@@ -1178,27 +1510,22 @@ static gboolean on_tick(gpointer user_data) {
   CPifyApp *p = (CPifyApp *)user_data;
   if (!p || !p->player || p->current_track_index < 0) return G_SOURCE_CONTINUE;
 
-  gint64 pos_ns = 0;
-  gint64 dur_ns = 0;
-  gboolean have_pos = cpify_player_query_position(p->player, &pos_ns);
-  gboolean have_dur = cpify_player_query_duration(p->player, &dur_ns);
-  if (!have_pos || !have_dur || dur_ns <= 0) return G_SOURCE_CONTINUE;
-
-  gdouble pos_s = (gdouble)pos_ns / (gdouble)GST_SECOND;
-  gdouble dur_s = (gdouble)dur_ns / (gdouble)GST_SECOND;
-
-  gtk_range_set_range(GTK_RANGE(p->progress_scale), 0.0, dur_s);
-  if (!p->progress_dragging) {
-    gtk_range_set_value(GTK_RANGE(p->progress_scale), pos_s);
+  // Cache the duration between ticks and only re-query it until it is first
+  // known, or when the pipeline reports a revised value (VBR files without a
+  // seek index and some Matroska/WebM start from an estimate)
+  if (cpify_player_take_duration_changed(p->player)) p->track_duration_ns = 0;
+  if (p->track_duration_ns <= 0) {
+    gint64 dur = 0;
+    if (!cpify_player_query_duration(p->player, &dur) || dur <= 0) return G_SOURCE_CONTINUE;
+    p->track_duration_ns = dur;
   }
 
-  gchar *left = format_time_seconds(pos_s);
-  gchar *right = format_time_seconds(dur_s);
-  gchar *combined = g_strdup_printf("%s / %s", left, right);
-  gtk_label_set_text(GTK_LABEL(p->time_label), combined);
-  g_free(combined);
-  g_free(left);
-  g_free(right);
+  gint64 pos_ns = 0;
+  gint64 dur_ns = p->track_duration_ns;
+  if (!cpify_player_query_position(p->player, &pos_ns)) return G_SOURCE_CONTINUE;
+
+  show_progress(p, (gdouble)pos_ns / (gdouble)GST_SECOND,
+                (gdouble)dur_ns / (gdouble)GST_SECOND);
   return G_SOURCE_CONTINUE;
 }
 
@@ -1284,7 +1611,9 @@ static GtkWidget *build_sidebar(CPifyApp *p) {
   p->search_entry = gtk_search_entry_new();
   gtk_widget_set_hexpand(p->search_entry, TRUE);
   g_object_set(p->search_entry, "placeholder-text", "Search songs…", NULL);
-  g_signal_connect(p->search_entry, "changed", G_CALLBACK(on_search_changed), p);
+  // search-changed is GtkSearchEntry's debounced variant of changed: fast
+  // typing or key repeat runs one search per pause instead of one per key
+  g_signal_connect(p->search_entry, "search-changed", G_CALLBACK(on_search_changed), p);
 
   GtkWidget *list_scroller = gtk_scrolled_window_new();
   gtk_scrolled_window_set_policy(GTK_SCROLLED_WINDOW(list_scroller), 
@@ -1294,6 +1623,7 @@ static GtkWidget *build_sidebar(CPifyApp *p) {
   p->listbox = gtk_list_box_new();
   gtk_list_box_set_activate_on_single_click(GTK_LIST_BOX(p->listbox), TRUE);
   gtk_widget_add_css_class(p->listbox, "navigation-sidebar");
+  gtk_list_box_set_filter_func(GTK_LIST_BOX(p->listbox), listbox_filter, p, NULL);
   g_signal_connect(p->listbox, "row-activated", G_CALLBACK(on_row_activated), p);
   gtk_scrolled_window_set_child(GTK_SCROLLED_WINDOW(list_scroller), p->listbox);
 
@@ -1419,7 +1749,7 @@ static GtkWidget *build_gallery_layout(CPifyApp *p) {
   p->gallery_search_entry = gtk_search_entry_new();
   gtk_widget_set_hexpand(p->gallery_search_entry, TRUE);
   g_object_set(p->gallery_search_entry, "placeholder-text", "Search songs…", NULL);
-  g_signal_connect(p->gallery_search_entry, "changed", G_CALLBACK(on_gallery_search_changed), p);
+  g_signal_connect(p->gallery_search_entry, "search-changed", G_CALLBACK(on_gallery_search_changed), p);
   
   // Scrolled window for the grid
   p->gallery_scroll = gtk_scrolled_window_new();
@@ -1436,6 +1766,7 @@ static GtkWidget *build_gallery_layout(CPifyApp *p) {
   gtk_flow_box_set_column_spacing(GTK_FLOW_BOX(p->gallery_grid), 8);
   gtk_flow_box_set_row_spacing(GTK_FLOW_BOX(p->gallery_grid), 8);
   gtk_flow_box_set_activate_on_single_click(GTK_FLOW_BOX(p->gallery_grid), TRUE);
+  gtk_flow_box_set_filter_func(GTK_FLOW_BOX(p->gallery_grid), gallery_filter, p, NULL);
   g_signal_connect(p->gallery_grid, "child-activated", G_CALLBACK(on_gallery_item_activated), p);
   
   gtk_scrolled_window_set_child(GTK_SCROLLED_WINDOW(p->gallery_scroll), p->gallery_grid);
@@ -1542,6 +1873,21 @@ static gboolean on_window_close_request(GtkWindow *window, gpointer user_data) {
     g_source_remove(p->tick_id);
     p->tick_id = 0;
   }
+  if (p->speed_apply_id) {
+    g_source_remove(p->speed_apply_id);
+    p->speed_apply_id = 0;
+  }
+  stop_thumbnail_generation(p);
+  if (p->thumb_pool) {
+    // Jobs still winding down keep the pool alive but must not touch p
+    p->thumb_pool->app = NULL;
+    g_rc_box_release(p->thumb_pool);
+    p->thumb_pool = NULL;
+  }
+  if (p->scan_cancellable) {
+    g_cancellable_cancel(p->scan_cancellable);
+    g_clear_object(&p->scan_cancellable);
+  }
   if (p->player) {
     cpify_player_free(p->player);
     p->player = NULL;
@@ -1554,6 +1900,20 @@ static gboolean on_window_close_request(GtkWindow *window, gpointer user_data) {
     g_array_unref(p->visible_tracks);
     p->visible_tracks = NULL;
   }
+  if (p->visible_pos_index) {
+    g_array_unref(p->visible_pos_index);
+    p->visible_pos_index = NULL;
+  }
+  if (p->list_icons) {
+    g_ptr_array_unref(p->list_icons);
+    p->list_icons = NULL;
+  }
+  if (p->gallery_placeholders) {
+    g_ptr_array_unref(p->gallery_placeholders);
+    p->gallery_placeholders = NULL;
+  }
+  g_free(p->visible_query);
+  p->visible_query = NULL;
   g_free(p->current_folder);
   p->current_folder = NULL;
   
@@ -1610,6 +1970,7 @@ CPifyApp *cpify_app_new(AdwApplication *app) {
   CPifyApp *p = g_new0(CPifyApp, 1);
   p->app = app;
   p->current_track_index = -1;
+  p->lit_icon_track = -1;
   p->is_playing = FALSE;
   p->progress_dragging = FALSE;
   p->player = NULL;
@@ -1715,7 +2076,6 @@ CPifyApp *cpify_app_new(AdwApplication *app) {
   update_sidebar_toggle_icon(p);
   update_play_button(p);
   visible_reset_all(p);
-  p->tick_id = g_timeout_add(250, on_tick, p);
   
   // Apply saved settings to UI
   {
@@ -12,50 +12,31 @@ static const gchar *AUDIO_EXTS[] = {
   ".mp3", ".flac", ".ogg", ".opus", ".wav", ".m4a", ".aac", ".wma",
 };
 
-gboolean cpify_is_video_file(const gchar *path) {
-  if (!path) return FALSE;
-  gchar *lower = g_ascii_strdown(path, -1);
-  gboolean is_video = FALSE;
-  for (guint i = 0; i < G_N_ELEMENTS(VIDEO_EXTS); i++) {
-    if (g_str_has_suffix(lower, VIDEO_EXTS[i])) {
-      is_video = TRUE;
-      break;
-    }
-  }
-  g_free(lower);
-  return is_video;
+// Returns the extension (including the dot) of the last path component, or NULL
+static const gchar *path_extension(const gchar *path) {
+  const gchar *dot = strrchr(path, '.');
+  if (!dot) return NULL;
+  const gchar *sep = strrchr(path, G_DIR_SEPARATOR);
+  if (sep && sep > dot) return NULL;
+  return dot;
 }
 
-static gboolean has_supported_extension(const gchar *path) {
-  if (!path) return FALSE;
-  gchar *lower = g_ascii_strdown(path, -1);
-  gboolean ok = FALSE;
-  
-  for (guint i = 0; i < G_N_ELEMENTS(VIDEO_EXTS); i++) {
-    if (g_str_has_suffix(lower, VIDEO_EXTS[i])) {
-      ok = TRUE;
-      break;
-    }
+static gboolean extension_in_list(const gchar *ext, const gchar **exts, guint n_exts) {
+  if (!ext) return FALSE;
+  for (guint i = 0; i < n_exts; i++) {
+    if (g_ascii_strcasecmp(ext, exts[i]) == 0) return TRUE;
   }
-  if (!ok) {
-    for (guint i = 0; i < G_N_ELEMENTS(AUDIO_EXTS); i++) {
-      if (g_str_has_suffix(lower, AUDIO_EXTS[i])) {
-        ok = TRUE;
-        break;
-      }
-    }
-  }
-  g_free(lower);
-  return ok;
+  return FALSE;
 }
 
-CPifyTrack *cpify_track_new(const gchar *abs_path) {
-  if (!abs_path) return NULL;
+static CPifyTrack *track_new(const gchar *abs_path, gboolean is_video) {
   CPifyTrack *t = g_new0(CPifyTrack, 1);
   t->path = g_strdup(abs_path);
   t->title = g_path_get_basename(abs_path);
-  t->is_video = cpify_is_video_file(abs_path);
+  t->search_key = g_utf8_strdown(t->title, -1);
+  t->is_video = is_video;
   t->thumbnail = NULL;
+  t->texture = NULL;
   return t;
 }
 
@@ -63,28 +44,44 @@ void cpify_track_free(CPifyTrack *track) {
   if (!track) return;
   g_free(track->path);
   g_free(track->title);
+  g_free(track->search_key);
   if (track->thumbnail) {
     g_object_unref(track->thumbnail);
     track->thumbnail = NULL;
   }
+  if (track->texture) {
+    g_object_unref(track->texture);
+    track->texture = NULL;
+  }
   g_free(track);
 }
 
-void cpify_track_generate_thumbnail(CPifyTrack *track) {
-  if (!track || !track->path || !track->is_video) return;
-  if (track->thumbnail) return;  // Already have one
+GdkTexture *cpify_track_get_texture(CPifyTrack *track) {
+  if (!track || !track->thumbnail) return NULL;
+  if (!track->texture) {
+    track->texture = gdk_texture_new_for_pixbuf(track->thumbnail);
+  }
+  return track->texture;
+}
+
+GdkPixbuf *cpify_generate_thumbnail_for_path(const gchar *path, GCancellable *cancellable) {
+  if (!path) return NULL;
   
   // Create a pipeline to extract a frame
   GError *err = NULL;
-  gchar *uri = g_filename_to_uri(track->path, NULL, &err);
+  gchar *uri = g_filename_to_uri(path, NULL, &err);
   if (!uri) {
     if (err) g_error_free(err);
-    return;
+    return NULL;
   }
   
-  // Build pipeline: uridecodebin ! videoconvert ! videoscale ! gdkpixbufsink
+  // Build pipeline: uridecodebin ! videoscale ! videoconvert ! gdkpixbufsink
+  // Only video is decoded (audio decoders are never plugged), and frames are
+  // scaled down in their native format before the colorspace conversion so
+  // videoconvert only touches thumbnail-sized buffers.
   gchar *pipeline_str = g_strdup_printf(
-    "uridecodebin uri=\"%s\" ! videoconvert ! videoscale ! "
+    "uridecodebin uri=\"%s\" caps=video/x-raw expose-all-streams=false ! "
+    "videoscale ! videoconvert ! "
     "video/x-raw,width=180,height=120 ! gdkpixbufsink name=sink",
     uri
   );
@@ -95,7 +92,7 @@ void cpify_track_generate_thumbnail(CPifyTrack *track) {
   
   if (!pipeline) {
     if (err) g_error_free(err);
-    return;
+    return NULL;
   }
   
   // Seek to 10% of the video for a good frame
@@ -103,10 +100,12 @@ void cpify_track_generate_thumbnail(CPifyTrack *track) {
   
   // Wait for state change
   GstStateChangeReturn ret = gst_element_get_state(pipeline, NULL, NULL, 2 * GST_SECOND);
-  if (ret == GST_STATE_CHANGE_FAILURE) {
+  // Preroll can take seconds; don't go on to seek for a caller that has
+  // already given up on this frame
+  if (ret == GST_STATE_CHANGE_FAILURE || g_cancellable_is_cancelled(cancellable)) {
     gst_element_set_state(pipeline, GST_STATE_NULL);
     gst_object_unref(pipeline);
-    return;
+    return NULL;
   }
   
   // Query duration and seek to 10%
@@ -117,31 +116,38 @@ void cpify_track_generate_thumbnail(CPifyTrack *track) {
                             GST_SEEK_FLAG_FLUSH | GST_SEEK_FLAG_KEY_UNIT, seek_pos);
     gst_element_get_state(pipeline, NULL, NULL, GST_SECOND);
   }
+  if (g_cancellable_is_cancelled(cancellable)) {
+    gst_element_set_state(pipeline, GST_STATE_NULL);
+    gst_object_unref(pipeline);
+    return NULL;
+  }
   
   // Get the pixbuf from the sink
+  GdkPixbuf *pixbuf = NULL;
   GstElement *sink = gst_bin_get_by_name(GST_BIN(pipeline), "sink");
   if (sink) {
-    GdkPixbuf *pixbuf = NULL;
-    g_object_get(sink, "last-pixbuf", &pixbuf, NULL);
-    if (pixbuf) {
-      track->thumbnail = pixbuf;  // Transfer ownership
-    }
+    g_object_get(sink, "last-pixbuf", &pixbuf, NULL);  // Transfer ownership
     gst_object_unref(sink);
   }
   
   gst_element_set_state(pipeline, GST_STATE_NULL);
   gst_object_unref(pipeline);
+  return pixbuf;
 }
 
-static void scan_dir_recursive(GPtrArray *out, GFile *dir, GCancellable *cancellable) {
+static void scan_dir_recursive(GPtrArray *out, const gchar *dir_path, GCancellable *cancellable) {
   GError *err = NULL;
+  GFile *dir = g_file_new_for_path(dir_path);
+  // Only name and type: GLib's local enumerator fills these from the dirent
+  // (d_type) and skips the per-entry stat() that other attributes would need
   GFileEnumerator *en = g_file_enumerate_children(
       dir,
-      "standard::name,standard::type,standard::is-symlink,standard::size",
+      G_FILE_ATTRIBUTE_STANDARD_NAME "," G_FILE_ATTRIBUTE_STANDARD_TYPE,
       G_FILE_QUERY_INFO_NOFOLLOW_SYMLINKS,
       cancellable,
       &err
   );
+  g_object_unref(dir);
   if (!en) {
     if (err) g_error_free(err);
     return;
@@ -158,25 +164,24 @@ static void scan_dir_recursive(GPtrArray *out, GFile *dir, GCancellable *cancell
       continue;
     }
 
-    GFile *child = g_file_get_child(dir, name);
-
+    // Child paths are joined straight from the parent's path string; files
+    // with unsupported extensions are rejected on the name alone, so they
+    // never cost a path allocation (or a GFile) at all
     if (type == G_FILE_TYPE_DIRECTORY) {
-      scan_dir_recursive(out, child, cancellable);
-      g_object_unref(child);
-      g_object_unref(info);
-      continue;
-    }
-
-    if (type == G_FILE_TYPE_REGULAR) {
-      gchar *path = g_file_get_path(child);
-      if (path && has_supported_extension(path)) {
-        CPifyTrack *t = cpify_track_new(path);
-        if (t) g_ptr_array_add(out, t);
+      gchar *child_path = g_build_filename(dir_path, name, NULL);
+      scan_dir_recursive(out, child_path, cancellable);
+      g_free(child_path);
+    } else if (type == G_FILE_TYPE_REGULAR) {
+      // Classify the extension once: it decides both inclusion and is_video
+      const gchar *ext = path_extension(name);
+      gboolean is_video = extension_in_list(ext, VIDEO_EXTS, G_N_ELEMENTS(VIDEO_EXTS));
+      if (is_video || extension_in_list(ext, AUDIO_EXTS, G_N_ELEMENTS(AUDIO_EXTS))) {
+        gchar *child_path = g_build_filename(dir_path, name, NULL);
+        g_ptr_array_add(out, track_new(child_path, is_video));
+        g_free(child_path);
       }
-      g_free(path);
     }
 
-    g_object_unref(child);
     g_object_unref(info);
   }
 
@@ -192,23 +197,42 @@ static gint track_title_cmp(gconstpointer a, gconstpointer b) {
   return g_ascii_strcasecmp(ta->title ? ta->title : "", tb->title ? tb->title : "");
 }
 
-GPtrArray *cpify_scan_folder(const gchar *folder_path, GError **error) {
-  if (!folder_path || folder_path[0] == '\0') {
-    g_set_error(error, G_IO_ERROR, G_IO_ERROR_INVALID_ARGUMENT, "Empty folder path");
-    return NULL;
+static void scan_folder_thread(GTask *task, gpointer source_object, gpointer task_data,
+                               GCancellable *cancellable) {
+  (void)source_object;
+  const gchar *folder_path = task_data;
+
+  GPtrArray *tracks = g_ptr_array_new_with_free_func((GDestroyNotify)cpify_track_free);
+  scan_dir_recursive(tracks, folder_path, cancellable);
+  if (g_task_return_error_if_cancelled(task)) {
+    g_ptr_array_unref(tracks);
+    return;
   }
 
-  GFile *root = g_file_new_for_path(folder_path);
-  if (!root) {
-    g_set_error(error, G_IO_ERROR, G_IO_ERROR_FAILED, "Unable to open folder");
-    return NULL;
+  g_ptr_array_sort(tracks, track_title_cmp);
+  g_task_return_pointer(task, tracks, (GDestroyNotify)g_ptr_array_unref);
+}
+
+void cpify_scan_folder_async(const gchar *folder_path,
+                             GCancellable *cancellable,
+                             GAsyncReadyCallback callback,
+                             gpointer user_data) {
+  GTask *task = g_task_new(NULL, cancellable, callback, user_data);
+  g_task_set_source_tag(task, cpify_scan_folder_async);
+
+  if (!folder_path || folder_path[0] == '\0') {
+    g_task_return_new_error(task, G_IO_ERROR, G_IO_ERROR_INVALID_ARGUMENT, "Empty folder path");
+    g_object_unref(task);
+    return;
   }
 
-  GPtrArray *tracks = g_ptr_array_new_with_free_func((GDestroyNotify)cpify_track_free);
-  scan_dir_recursive(tracks, root, NULL);
-  g_object_unref(root);
+  g_task_set_task_data(task, g_strdup(folder_path), g_free);
+  g_task_run_in_thread(task, scan_folder_thread);
+  g_object_unref(task);
+}
 
-  g_ptr_array_sort(tracks, track_title_cmp);
-  return tracks;
+GPtrArray *cpify_scan_folder_finish(GAsyncResult *result, GError **error) {
+  g_return_val_if_fail(g_task_is_valid(result, NULL), NULL);
+  return g_task_propagate_pointer(G_TASK(result), error);
 }
 
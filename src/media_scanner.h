@@ -1,23 +1,35 @@
 #pragma once
 
 #include <glib.h>
+#include <gio/gio.h>
 #include <gdk-pixbuf/gdk-pixbuf.h>
+#include <gdk/gdk.h>
 
 typedef struct {
   gchar *path;         // absolute file path
   gchar *title;        // display name
+  gchar *search_key;   // lowercased title, precomputed for search matching
   GdkPixbuf *thumbnail; // video thumbnail (can be NULL)
+  GdkTexture *texture;  // texture built from thumbnail, created on first use (can be NULL)
   gboolean is_video;   // TRUE if this is a video file
 } CPifyTrack;
 
-CPifyTrack *cpify_track_new(const gchar *abs_path);
 void cpify_track_free(CPifyTrack *track);
 
-// Returns a GPtrArray of CPifyTrack* (free with g_ptr_array_unref)
-GPtrArray *cpify_scan_folder(const gchar *folder_path, GError **error);
+// Scan folder_path on a worker thread; callback runs on the calling thread's
+// main context. cpify_scan_folder_finish returns a GPtrArray of CPifyTrack*
+// sorted by title (free with g_ptr_array_unref).
+void cpify_scan_folder_async(const gchar *folder_path,
+                             GCancellable *cancellable,
+                             GAsyncReadyCallback callback,
+                             gpointer user_data);
+GPtrArray *cpify_scan_folder_finish(GAsyncResult *result, GError **error);
 
-// Generate thumbnail for a track (call asynchronously)
-void cpify_track_generate_thumbnail(CPifyTrack *track);
+// Extract a thumbnail frame from the video at path. Touches no shared state,
+// so it is safe to call from a worker thread. Returns NULL on failure or if
+// cancellable (may be NULL) is cancelled between pipeline steps.
+GdkPixbuf *cpify_generate_thumbnail_for_path(const gchar *path, GCancellable *cancellable);
 
-// Check if file is a video based on extension
-gboolean cpify_is_video_file(const gchar *path);
+// Returns the cached texture for the track's thumbnail, creating it on first
+// call. Returns NULL if there is no thumbnail. The track keeps ownership.
+GdkTexture *cpify_track_get_texture(CPifyTrack *track);
@@ -65,6 +65,11 @@ static gboolean on_bus_message(GstBus *bus, GstMessage *msg, gpointer user_data)
       g_print("[DEBUG] Async done - pipeline ready\n");
       break;
     
+    case GST_MESSAGE_DURATION_CHANGED:
+      // The message carries no value; consumers re-query the duration
+      p->duration_changed = TRUE;
+      break;
+    
     default:
       break;
   }
@@ -72,15 +77,20 @@ static gboolean on_bus_message(GstBus *bus, GstMessage *msg, gpointer user_data)
   return G_SOURCE_CONTINUE;
 }
 
+#define CPIFY_DEBUG_FRAME_COUNT 5
+
 static void on_paintable_invalidate(GdkPaintable *paintable, gpointer user_data) {
-  (void)user_data;
   static int frame_count = 0;
   frame_count++;
-  if (frame_count <= 5 || frame_count % 100 == 0) {
-    g_print("[DEBUG] Paintable invalidated (frame %d), size: %dx%d\n", 
-            frame_count,
-            gdk_paintable_get_intrinsic_width(paintable),
-            gdk_paintable_get_intrinsic_height(paintable));
+  g_print("[DEBUG] Paintable invalidated (frame %d), size: %dx%d\n",
+          frame_count,
+          gdk_paintable_get_intrinsic_width(paintable),
+          gdk_paintable_get_intrinsic_height(paintable));
+
+  // Only the first frames are useful to confirm video is arriving; stop
+  // running a signal handler for every decoded frame after that
+  if (frame_count >= CPIFY_DEBUG_FRAME_COUNT) {
+    g_signal_handlers_disconnect_by_func(paintable, G_CALLBACK(on_paintable_invalidate), user_data);
   }
 }
 
@@ -307,10 +317,16 @@ gboolean cpify_player_set_path(CPifyPlayer *p, const gchar *abs_path, GError **e
   // Stop current playback
   gst_element_set_state(p->pipeline, GST_STATE_NULL);
   
-  // Convert path to URI using GFile for proper handling of special characters
-  GFile *file = g_file_new_for_path(abs_path);
-  gchar *uri = g_file_get_uri(file);
-  g_object_unref(file);
+  // Scanned paths are already absolute, so escape them straight into a URI;
+  // only a relative path needs GFile to resolve it against the cwd first
+  gchar *uri = NULL;
+  if (g_path_is_absolute(abs_path)) {
+    uri = g_filename_to_uri(abs_path, NULL, NULL);
+  } else {
+    GFile *file = g_file_new_for_path(abs_path);
+    uri = g_file_get_uri(file);
+    g_object_unref(file);
+  }
   
   if (!uri) {
     g_set_error(error, G_IO_ERROR, G_IO_ERROR_FAILED, "Unable to build URI from path");
@@ -318,8 +334,8 @@ gboolean cpify_player_set_path(CPifyPlayer *p, const gchar *abs_path, GError **e
   }
   
   g_print("[DEBUG] cpify_player_set_path: URI='%s'\n", uri);
-  g_print("[DEBUG] cpify_player_set_path: file exists=%d\n", g_file_test(abs_path, G_FILE_TEST_EXISTS));
-  
+  p->duration_changed = FALSE;
+
   // Set flags
   guint flags = 0;
   g_object_get(p->pipeline, "flags", &flags, NULL);
@@ -371,6 +387,9 @@ void cpify_player_set_volume(CPifyPlayer *p, gdouble volume_0_to_1) {
   if (!p) return;
   if (volume_0_to_1 < 0.0) volume_0_to_1 = 0.0;
   if (volume_0_to_1 > 1.0) volume_0_to_1 = 1.0;
+  // The pipeline already has p->volume (set_path applies it on every load),
+  // so an unchanged value would only re-notify the sink
+  if (volume_0_to_1 == p->volume) return;
   p->volume = volume_0_to_1;
   
   if (p->pipeline) {
@@ -380,7 +399,9 @@ void cpify_player_set_volume(CPifyPlayer *p, gdouble volume_0_to_1) {
 
 void cpify_player_set_audio_enabled(CPifyPlayer *p, gboolean enabled) {
   if (!p) return;
-  p->audio_enabled = enabled ? TRUE : FALSE;
+  enabled = enabled ? TRUE : FALSE;
+  if (enabled == p->audio_enabled) return;  // Flags already match (see set_path)
+  p->audio_enabled = enabled;
   
   if (p->pipeline) {
     guint flags = 0;
@@ -430,7 +451,7 @@ gboolean cpify_player_seek_to(CPifyPlayer *p, gdouble position_seconds) {
                           GST_SEEK_TYPE_NONE, 0);
 }
 
-gboolean cpify_player_seek_relative(CPifyPlayer *p, gdouble delta_seconds) {
+gboolean cpify_player_seek_relative(CPifyPlayer *p, gdouble delta_seconds, gdouble *out_target_seconds) {
   if (!p || !p->pipeline) return FALSE;
   
   gint64 position = 0;
@@ -442,11 +463,13 @@ gboolean cpify_player_seek_relative(CPifyPlayer *p, gdouble delta_seconds) {
   gint64 target = position + delta_ns;
   if (target < 0) target = 0;
   
-  return gst_element_seek(p->pipeline, p->rate,
-                          GST_FORMAT_TIME,
-                          GST_SEEK_FLAG_FLUSH | GST_SEEK_FLAG_ACCURATE,
-                          GST_SEEK_TYPE_SET, target,
-                          GST_SEEK_TYPE_NONE, 0);
+  gboolean ok = gst_element_seek(p->pipeline, p->rate,
+                                 GST_FORMAT_TIME,
+                                 GST_SEEK_FLAG_FLUSH | GST_SEEK_FLAG_ACCURATE,
+                                 GST_SEEK_TYPE_SET, target,
+                                 GST_SEEK_TYPE_NONE, 0);
+  if (ok && out_target_seconds) *out_target_seconds = (gdouble)target / (gdouble)GST_SECOND;
+  return ok;
 }
 
 gboolean cpify_player_query_position(CPifyPlayer *p, gint64 *out_position_ns) {
@@ -458,3 +481,9 @@ gboolean cpify_player_query_duration(CPifyPlayer *p, gint64 *out_duration_ns) {
   if (!p || !p->pipeline || !out_duration_ns) return FALSE;
   return gst_element_query_duration(p->pipeline, GST_FORMAT_TIME, out_duration_ns);
 }
+
+gboolean cpify_player_take_duration_changed(CPifyPlayer *p) {
+  if (!p || !p->duration_changed) return FALSE;
+  p->duration_changed = FALSE;
+  return TRUE;
+}
@@ -23,6 +23,7 @@ typedef struct {
   gboolean video_enabled;
   gdouble volume;  // 0..1
   gdouble rate;    // playback rate (1.0 = normal)
+  gboolean duration_changed;  // Set when the pipeline posts DURATION_CHANGED
 } CPifyPlayer;
 
 CPifyPlayer *cpify_player_new(void);
@@ -43,8 +44,15 @@ void cpify_player_set_audio_enabled(CPifyPlayer *player, gboolean enabled);
 void cpify_player_set_video_enabled(CPifyPlayer *player, gboolean enabled);
 void cpify_player_set_rate(CPifyPlayer *player, gdouble rate);
 
-gboolean cpify_player_seek_relative(CPifyPlayer *player, gdouble delta_seconds);
+// On success, stores the absolute position sought to in out_target_seconds
+// (may be NULL)
+gboolean cpify_player_seek_relative(CPifyPlayer *player, gdouble delta_seconds,
+                                    gdouble *out_target_seconds);
 gboolean cpify_player_seek_to(CPifyPlayer *player, gdouble position_seconds);
 
 gboolean cpify_player_query_position(CPifyPlayer *player, gint64 *out_position_ns);
 gboolean cpify_player_query_duration(CPifyPlayer *player, gint64 *out_duration_ns);
+
+// Returns TRUE (once) if the duration was revised since the last call, e.g. a
+// VBR file whose initial estimate was refined; re-query the duration then
+gboolean cpify_player_take_duration_changed(CPifyPlayer *player);
@@ -3,21 +3,52 @@
 
 static CPifySettings *g_settings = NULL;
 static gchar *g_settings_path = NULL;
+static gboolean g_settings_dir_ready = FALSE;
+static gchar *g_saved_data = NULL;  // Serialized contents of the file on disk
+static guint g_save_source_id = 0;  // Pending debounced write
+
+// Slider drags and rapid toggles call save many times a second; writes are
+// deferred until changes have been quiet for this long
+#define CPIFY_SETTINGS_SAVE_DELAY_MS 500
 
 static gchar *get_settings_path(void) {
   if (!g_settings_path) {
-    const gchar *config_dir = g_get_user_config_dir();
-    gchar *app_dir = g_build_filename(config_dir, "cpify", NULL);
-    
-    // Create directory if it doesn't exist
-    g_mkdir_with_parents(app_dir, 0755);
-    
-    g_settings_path = g_build_filename(app_dir, "settings.conf", NULL);
-    g_free(app_dir);
+    g_settings_path = g_build_filename(g_get_user_config_dir(), "cpify", "settings.conf", NULL);
   }
   return g_settings_path;
 }
 
+// Create the config directory the first time we write to it. Loading never
+// needs it to exist, so startup with an existing settings file does no mkdir.
+static void ensure_settings_dir(void) {
+  if (g_settings_dir_ready) return;
+  gchar *app_dir = g_path_get_dirname(get_settings_path());
+  g_mkdir_with_parents(app_dir, 0755);
+  g_free(app_dir);
+  g_settings_dir_ready = TRUE;
+}
+
+static gchar *serialize_settings(void) {
+  GKeyFile *kf = g_key_file_new();
+  
+  // General settings
+  g_key_file_set_integer(kf, "General", "theme", (gint)g_settings->theme);
+  g_key_file_set_integer(kf, "General", "layout", g_settings->layout);
+  if (g_settings->last_folder) {
+    g_key_file_set_string(kf, "General", "last_folder", g_settings->last_folder);
+  }
+  
+  // Playback settings
+  g_key_file_set_double(kf, "Playback", "volume", g_settings->volume);
+  g_key_file_set_double(kf, "Playback", "speed", g_settings->speed);
+  g_key_file_set_boolean(kf, "Playback", "audio_enabled", g_settings->audio_enabled);
+  g_key_file_set_boolean(kf, "Playback", "video_enabled", g_settings->video_enabled);
+  
+  gchar *data = g_key_file_to_data(kf, NULL, NULL);
+  g_key_file_free(kf);
+  return data;
+}
+
 void cpify_settings_init(void) {
   if (g_settings) return;
   
@@ -62,6 +93,8 @@ void cpify_settings_init(void) {
     }
     
     g_print("[SETTINGS] Loaded settings from %s\n", get_settings_path());
+    // Remember what is on disk so re-applying the loaded values doesn't rewrite it
+    g_saved_data = serialize_settings();
   } else {
     g_print("[SETTINGS] No settings file found, using defaults\n");
     if (err) g_error_free(err);
@@ -77,37 +110,52 @@ CPifySettings *cpify_settings_get(void) {
   return g_settings;
 }
 
-void cpify_settings_save(void) {
+static void write_settings(void) {
   if (!g_settings) return;
   
-  GKeyFile *kf = g_key_file_new();
-  
-  // General settings
-  g_key_file_set_integer(kf, "General", "theme", (gint)g_settings->theme);
-  g_key_file_set_integer(kf, "General", "layout", g_settings->layout);
-  if (g_settings->last_folder) {
-    g_key_file_set_string(kf, "General", "last_folder", g_settings->last_folder);
+  // Nothing changed since the last load/save - skip the disk write
+  gchar *data = serialize_settings();
+  if (g_strcmp0(data, g_saved_data) == 0) {
+    g_free(data);
+    return;
   }
   
-  // Playback settings
-  g_key_file_set_double(kf, "Playback", "volume", g_settings->volume);
-  g_key_file_set_double(kf, "Playback", "speed", g_settings->speed);
-  g_key_file_set_boolean(kf, "Playback", "audio_enabled", g_settings->audio_enabled);
-  g_key_file_set_boolean(kf, "Playback", "video_enabled", g_settings->video_enabled);
-  
   // Save to file
+  ensure_settings_dir();
   GError *err = NULL;
-  if (!g_key_file_save_to_file(kf, get_settings_path(), &err)) {
+  if (!g_file_set_contents(get_settings_path(), data, -1, &err)) {
     g_printerr("[SETTINGS] Failed to save: %s\n", err ? err->message : "unknown");
     if (err) g_error_free(err);
+    g_free(data);
   } else {
     g_print("[SETTINGS] Saved settings to %s\n", get_settings_path());
+    g_free(g_saved_data);
+    g_saved_data = data;
   }
+}
+
+static gboolean save_timeout(gpointer user_data) {
+  (void)user_data;
+  g_save_source_id = 0;
+  write_settings();
+  return G_SOURCE_REMOVE;
+}
+
+void cpify_settings_save(void) {
+  if (!g_settings) return;
   
-  g_key_file_free(kf);
+  // Restart the quiet period so a burst of changes costs a single write
+  if (g_save_source_id) g_source_remove(g_save_source_id);
+  g_save_source_id = g_timeout_add(CPIFY_SETTINGS_SAVE_DELAY_MS, save_timeout, NULL);
 }
 
 void cpify_settings_cleanup(void) {
+  // Write out anything still waiting on the debounce timer
+  if (g_save_source_id) {
+    g_source_remove(g_save_source_id);
+    g_save_source_id = 0;
+    write_settings();
+  }
   if (g_settings) {
     g_free(g_settings->last_folder);
     g_free(g_settings);
@@ -115,6 +163,9 @@ void cpify_settings_cleanup(void) {
   }
   g_free(g_settings_path);
   g_settings_path = NULL;
+  g_settings_dir_ready = FALSE;
+  g_free(g_saved_data);
+  g_saved_data = NULL;
 }
 
 void cpify_settings_apply_theme(AdwApplication *app, CPifyTheme theme) {
@@ -25,7 +25,7 @@ void cpify_settings_init(void);
 // Get the global settings instance
 CPifySettings *cpify_settings_get(void);
 
-// Save settings to disk
+// Save settings to disk (debounced; pending changes are written on cleanup)
 void cpify_settings_save(void);
 
 // Free settings resources
@@ -58,10 +58,19 @@ void cpify_sound_effects_init(void) {
     return;
   }
   
+  // The clip never changes, so resolve its URI once here; playbin keeps it
+  // across NULL state resets and each click only has to restart the pipeline
+  gchar *uri = gst_filename_to_uri(click_sound_path, NULL);
+  if (!uri) {
+    g_printerr("[SFX] Failed to create URI for sound file\n");
+    return;
+  }
+  
   // Create the playbin for sound effects
   sound_pipeline = gst_element_factory_make("playbin", "sfx-playbin");
   if (!sound_pipeline) {
     g_printerr("[SFX] Warning: Unable to create sound effect pipeline\n");
+    g_free(uri);
     return;
   }
   
@@ -72,6 +81,8 @@ void cpify_sound_effects_init(void) {
   // Pre-configure with low latency settings
   // Set volume to a reasonable level for UI feedback (not too loud)
   g_object_set(sound_pipeline, "volume", 0.5, NULL);
+  g_object_set(sound_pipeline, "uri", uri, NULL);
+  g_free(uri);
   
   g_print("[SFX] Sound effects system initialized\n");
 }
@@ -106,17 +117,5 @@ void cpify_play_click_sound(void) {
   
   // Reset pipeline to NULL first for rapid successive plays
   gst_element_set_state(sound_pipeline, GST_STATE_NULL);
-  
-  // Convert path to URI
-  gchar *uri = gst_filename_to_uri(click_sound_path, NULL);
-  if (!uri) {
-    g_printerr("[SFX] Failed to create URI for sound file\n");
-    return;
-  }
-  
-  // Set the URI and play
-  g_object_set(sound_pipeline, "uri", uri, NULL);
   gst_element_set_state(sound_pipeline, GST_STATE_PLAYING);
-  
-  g_free(uri);
 }
@@ -23,6 +23,11 @@ typedef struct {
 
   // Track dark mode preference
   gboolean is_dark_mode;
+  gboolean background_applied;  // A background class has been set
+  gboolean background_dark;     // Whether that class is the dark variant
+
+  // Logo textures loaded so far, indexed by dark mode (0 = light, 1 = dark)
+  GdkTexture *logo_textures[2];
 } SplashData;
 
 // Animation timing (in milliseconds)
@@ -55,24 +60,29 @@ static void update_logo_for_theme(SplashData *data) {
   if (dark != data->is_dark_mode || !gtk_image_get_paintable(GTK_IMAGE(data->logo_image))) {
     data->is_dark_mode = dark;
 
-    const gchar *logo_filename = dark ? 
-      "CPify Dark Mode Logo.svg" : "CPify Light Mode Logo.svg";
-    
-    gchar *logo_path = cpify_find_asset_path(logo_filename);
-    
-    if (!logo_path) {
-      g_printerr("Warning: Could not find logo file: %s\n", logo_filename);
-      return;
+    // Each SVG is parsed and rasterized once; later theme flips reuse it
+    GdkTexture **slot = &data->logo_textures[dark ? 1 : 0];
+    if (!*slot) {
+      const gchar *logo_filename = dark ? 
+        "CPify Dark Mode Logo.svg" : "CPify Light Mode Logo.svg";
+      
+      gchar *logo_path = cpify_find_asset_path(logo_filename);
+      
+      if (!logo_path) {
+        g_printerr("Warning: Could not find logo file: %s\n", logo_filename);
+        return;
+      }
+
+      *slot = gdk_texture_new_from_filename(logo_path, NULL);
+      if (!*slot) {
+        g_printerr("Warning: Could not load logo as texture: %s\n", logo_path);
+      }
+      g_free(logo_path);
     }
 
-    GdkTexture *texture = gdk_texture_new_from_filename(logo_path, NULL);
-    if (texture) {
-      gtk_image_set_from_paintable(GTK_IMAGE(data->logo_image), GDK_PAINTABLE(texture));
-      g_object_unref(texture);
-    } else {
-      g_printerr("Warning: Could not load logo as texture: %s\n", logo_path);
+    if (*slot) {
+      gtk_image_set_from_paintable(GTK_IMAGE(data->logo_image), GDK_PAINTABLE(*slot));
     }
-    g_free(logo_path);
   }
 }
 
@@ -163,6 +173,8 @@ static void splash_data_free(gpointer user_data) {
   AdwStyleManager *style_manager = adw_style_manager_get_default();
   g_signal_handlers_disconnect_by_data(style_manager, data);
 
+  g_clear_object(&data->logo_textures[0]);
+  g_clear_object(&data->logo_textures[1]);
   g_free(data);
 }
 
@@ -208,6 +220,12 @@ static void update_splash_background_class(SplashData *data) {
   AdwStyleManager *style_manager = adw_style_manager_get_default();
   gboolean dark = adw_style_manager_get_dark(style_manager);
 
+  // Swapping classes restyles the whole splash subtree; only do it on an
+  // actual light/dark flip
+  if (data->background_applied && data->background_dark == dark) return;
+  data->background_applied = TRUE;
+  data->background_dark = dark;
+
   gtk_widget_remove_css_class(data->overlay, "splash-background");
   gtk_widget_remove_css_class(data->overlay, "splash-background-dark");
 